@@ -5,7 +5,6 @@ Serves files from the current directory over HTTP.
 """
 
 import http.server
-import socketserver
 import sys
 import os
 
@@ -13,6 +12,41 @@ import os
 DEFAULT_PORT = 8000
 HOST = "localhost"
 
+
+class FastHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
+    """Request handler that serves file bodies with zero-copy sendfile."""
+
+    def copyfile(self, source, outputfile):
+        # os.sendfile copies straight from the page cache to the socket,
+        # so file bytes never round-trip through Python buffers.
+        try:
+            infd = source.fileno()
+            outfd = outputfile.fileno()
+        except (AttributeError, OSError):
+            # Not a real file/socket pair (e.g. directory listing in BytesIO)
+            super().copyfile(source, outputfile)
+            return
+
+        try:
+            offset = 0
+            remaining = os.fstat(infd).st_size
+            while remaining > 0:
+                sent = os.sendfile(outfd, infd, offset, remaining)
+                if sent == 0:
+                    break
+                offset += sent
+                remaining -= sent
+        except (AttributeError, OSError):
+            if offset:
+                # Part of the body is already on the socket; restarting from
+                # the top would duplicate those bytes and corrupt the
+                # response, so let the caller see the failure instead
+                raise
+            # sendfile unavailable or failed up front - fall back to
+            # buffered copy
+            super().copyfile(source, outputfile)
+
+
 def main():
     # Get port from command line argument or use default
     port = DEFAULT_PORT
@@ -25,10 +59,12 @@ def main():
             sys.exit(1)
     
     # Create server
-    handler = http.server.SimpleHTTPRequestHandler
-    
+    handler = FastHTTPRequestHandler
+
     try:
-        with socketserver.TCPServer((HOST, port), handler) as httpd:
+        # ThreadingHTTPServer handles each request on its own thread, so a
+        # page pulling several assets at once doesn't serialize on one socket.
+        with http.server.ThreadingHTTPServer((HOST, port), handler) as httpd:
             print(f"Server running at http://{HOST}:{port}/")
             print(f"Serving files from: {os.getcwd()}")
             print("Press Ctrl+C to stop the server")
@@ -8,9 +8,83 @@ A command line utility for building and managing sites.
 # CONSTANTS
 # ============================================================================
 
-ALLOWED_EXTENSIONS = {'hsb', 'txt', 'htm', 'html', 'utf8', 'u8', ''}
+ALLOWED_EXTENSIONS = frozenset({'hsb', 'txt', 'htm', 'html', 'utf8', 'u8', ''})
 DEFAULT_TWITTER_CARD_TYPE = 'summary_large_image'
 
+# Batch builds below this size run serially; a process pool costs more to
+# spin up than it saves on a handful of files
+MIN_FILES_FOR_PARALLEL = 4
+
+# Meta tag templates keyed by frontmatter field, defined once at module load
+# so emitting a block is a single filtered comprehension instead of a ladder
+# of per-field branches. Order matters: it matches the emitted tag order.
+_OG_FIELDS = (
+    ('pageTitle', '\n\t<meta property="og:title" content="{}">'),
+    ('openGraphType', '\n\t<meta property="og:type" content="{}">'),
+    ('canonicalAddress', '\n\t<meta property="og:url" content="{}">'),
+    ('pageImage', '\n\t<meta property="og:image" content="{}">'),
+    ('pageDescription', '\n\t<meta property="og:description" content="{}">'),
+    ('siteName', '\n\t<meta property="og:site_name" content="{}">'),
+)
+
+_OG_ARTICLE_FIELDS = (
+    ('author', '\n\t<meta property="article:author" content="{}">'),
+    ('articleSection', '\n\t<meta property="article:section" content="{}">'),
+    ('articleTags', '\n\t<meta property="article:tag" content="{}">'),
+)
+
+_TWITTER_FIELDS = (
+    ('twitterCardType', '\n\t<meta name="twitter:card" content="{}">'),
+    ('pageTitle', '\n\t<meta name="twitter:title" content="{}">'),
+    ('pageDescription', '\n\t<meta name="twitter:description" content="{}">'),
+    ('pageImage', '\n\t<meta name="twitter:image" content="{}">'),
+    ('twitterUser', '\n\t<meta name="twitter:site" content="{0}">'
+                    '\n\t<meta name="twitter:creator" content="{0}">'),
+)
+
+# Translation table for escaping manifest values interpolated into head HTML.
+# str.translate runs in one C-level pass, noticeably cheaper than html.escape
+# on the short strings manifests contain.
+_ATTR_ESCAPE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;'})
+
+
+def _escapeAttr(value):
+    """Escape a manifest value for interpolation into head HTML."""
+    return str(value).translate(_ATTR_ESCAPE)
+
+
+# Manifest fields swept once per file: (manifest key, frontmatter key, verbose
+# label, head-content builder). A None frontmatter key skips the frontmatter
+# dict; a None builder adds nothing to the head. Order matters: head content
+# is emitted in table order.
+_FM_FIELDS = (
+    ('robotDirectives', None, 'Page robot directives',
+     lambda v: f"\n\t<meta name=\"robots\" content=\"{_escapeAttr(v)}\">"),
+    ('title', 'pageTitle', 'Page title',
+     lambda v: f"\n\t<title>{_escapeAttr(v)}</title>"),
+    ('description', 'pageDescription', 'Page description',
+     lambda v: f"\n\t<meta name=\"description\" content=\"{_escapeAttr(v)}\">"),
+    ('keywords', 'articleTags', 'Page keywords',
+     lambda v: f"\n\t<meta name=\"keywords\" content=\"{_escapeAttr(v)}\">"),
+    ('canonical', 'canonicalAddress', 'Page canonical',
+     lambda v: f"\n\t<link rel=\"canonical\" href=\"{_escapeAttr(v)}\">"),
+    ('author', 'author', 'Page author', None),
+    ('date_published', 'datePublished', 'Page date published', None),
+    ('date_modified', 'dateModified', 'Page date modified', None),
+    ('article_section', 'articleSection', 'Page article section', None),
+    ('open_graph_type', 'openGraphType', 'Page open graph type', None),
+    ('twitter_user', 'twitterUser', 'Page twitter user', None),
+    ('main_entity_of_page', 'mainEntityOfPage', 'Schema.org main entity of page', None),
+    ('schema_org_type', 'schemaOrgType', 'Schema.org type', None),
+    ('page_image', 'pageImage', 'Page image', None),
+    ('site_name', 'siteName', 'Site name', None),
+    ('author_type', 'authorType', 'Author type', None),
+    ('author_url', 'authorUrl', 'Author URL', None),
+    ('publisher', 'publisher', 'Publisher name', None),
+    ('publisher_type', 'publisherType', 'Publisher type', None),
+    ('publisher_url', 'publisherUrl', 'Publisher URL', None),
+)
+
 # ============================================================================
 # IMPORTS
 # ============================================================================
@@ -18,15 +92,75 @@ DEFAULT_TWITTER_CARD_TYPE = 'summary_large_image'
 import sys
 import os
 import argparse
-import yaml
+import bisect
+import concurrent.futures
+import functools
+import hashlib
+import io
+import json
+import operator
+import textwrap
 import re
 
-try:
-    from rich import print as rprint
-    from rich.console import Console
-    richAvailable = True
-except ImportError:
-    richAvailable = False
+# Getters bound once at module load so the per-file manifest sweep runs on
+# C-level attrgetter reads instead of a getattr() call per field. Built here
+# rather than next to _FM_FIELDS because it needs the operator import.
+_FM_GETTERS = tuple(
+    (operator.attrgetter(key), fk, label, fn) for key, fk, label, fn in _FM_FIELDS
+)
+
+# yaml and rich are imported lazily (see _getYaml/_getRichPrint) so that
+# --help and other runs that never touch a manifest skip their import cost.
+
+
+# ============================================================================
+# LAZY OPTIONAL IMPORTS
+# ============================================================================
+
+_YAML = None
+_YAML_LOADER = None
+_RICH_PRINT = None
+_RICH_CHECKED = False
+
+# Set from --verbose in main() so lazy importers can report what they picked
+_VERBOSE_IMPORTS = False
+
+
+def _getYaml():
+    """
+    Import PyYAML on first use and return (module, loader class).
+
+    Prefers the libyaml C parser when PyYAML was built against it; the
+    pure-Python loader produces identical data but is several times slower
+    per manifest.
+    """
+    global _YAML, _YAML_LOADER
+    if _YAML is None:
+        import yaml
+        try:
+            from yaml import CSafeLoader as loader
+        except ImportError:
+            from yaml import SafeLoader as loader
+            if _VERBOSE_IMPORTS:
+                print(f"{Colors.YELLOW}NOTE: libyaml not available, using the slower pure-Python "
+                      f"YAML parser. Install with 'pip install pyyaml[libyaml]' for faster builds.{Colors.ENDC}",
+                      file=sys.stderr)
+        _YAML = yaml
+        _YAML_LOADER = loader
+    return _YAML, _YAML_LOADER
+
+
+def _getRichPrint():
+    """Return rich's print function on first use, or None if unavailable."""
+    global _RICH_PRINT, _RICH_CHECKED
+    if not _RICH_CHECKED:
+        _RICH_CHECKED = True
+        try:
+            from rich import print as rprint
+            _RICH_PRINT = rprint
+        except ImportError:
+            _RICH_PRINT = None
+    return _RICH_PRINT
 
 
 # ============================================================================
@@ -53,36 +187,162 @@ class Colors:
 class Manifest:
     """
     Wrapper class for manifest data that provides attribute-style access.
-    
+
+    Manifest keys are folded straight into the instance __dict__, so reads of
+    present keys take CPython's normal C-level attribute path; __getattr__ is
+    only entered for missing keys and just returns None. Keys that would
+    shadow the class API itself (e.g. a top-level 'get' key) are dropped so
+    manifest.get(...) call sites keep working on any input.
+
     Usage:
         manifest = Manifest({'title': 'My Page', 'add_to_header': ['<meta>']})
         print(manifest.title)  # 'My Page'
         print(manifest.add_to_header)  # ['<meta>']
         print(manifest.nonexistent)  # None
     """
-    
+
     def __init__(self, data=None):
         """Initialize manifest with optional data dictionary."""
-        self._data = data if data is not None else {}
-    
+        if data:
+            if _MANIFEST_RESERVED.isdisjoint(data):
+                self.__dict__.update(data)
+            else:
+                # Drop keys that collide with the class API; folding them
+                # would replace methods like get() with manifest data
+                self.__dict__.update(
+                    (key, value) for key, value in data.items()
+                    if key not in _MANIFEST_RESERVED)
+
     def __getattr__(self, name):
-        """Allow attribute-style access to manifest data."""
-        if name.startswith('_'):
-            # Avoid infinite recursion for private attributes
-            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
-        return self._data.get(name)
-    
+        """Return None for manifest keys that are not present."""
+        return None
+
     def __contains__(self, key):
         """Support 'in' operator."""
-        return key in self._data
-    
+        return key in self.__dict__
+
     def get(self, key, default=None):
         """Dictionary-style get method."""
-        return self._data.get(key, default)
-    
+        return self.__dict__.get(key, default)
+
     def __repr__(self):
         """String representation for debugging."""
-        return f"Manifest({self._data})"
+        return f"Manifest({self.__dict__})"
+
+
+# Class API names that manifest data is not allowed to shadow; checked once
+# per manifest with a frozenset rather than hasattr() per key
+_MANIFEST_RESERVED = frozenset(dir(Manifest))
+
+
+# ============================================================================
+# MANIFEST CACHE
+# ============================================================================
+
+# Directory for build caches, created next to wherever the builder is run
+CACHE_DIR = '.hsb_cache'
+
+
+class ManifestCache:
+    """
+    Persistent cache of parsed manifest YAML, keyed by content hash.
+
+    YAML parsing is by far the slowest part of reading a manifest; storing the
+    parsed dict in a JSON sidecar (.hsb_cache/manifest.json) turns re-parses
+    of unchanged manifests into a dict lookup on the next run. Entries whose
+    values don't round-trip through JSON (e.g. timezone-aware dates) are kept
+    for the current run only, so cached and fresh parses always agree.
+    """
+
+    def __init__(self, cache_dir=CACHE_DIR):
+        """Initialize the cache rooted at the given cache directory."""
+        self._path = os.path.join(cache_dir, 'manifest.json')
+        self._entries = {}
+        self._new = {}
+        self._dirty = False
+
+    def load(self):
+        """Load previously persisted entries; a missing or bad file is fine."""
+        try:
+            with open(self._path, 'r', encoding='utf-8') as f:
+                self._entries = json.load(f)
+        except (OSError, ValueError):
+            self._entries = {}
+
+    def get(self, key):
+        """Return the cached manifest dict for a content hash, or None."""
+        return self._entries.get(key)
+
+    def put(self, key, manifest_data):
+        """Store a parsed manifest, persisting it only if JSON-safe."""
+        try:
+            json.dumps(manifest_data)
+        except (TypeError, ValueError):
+            # Not JSON-representable (datetimes etc.) - reparse next run
+            return
+        self._entries[key] = manifest_data
+        self._new[key] = manifest_data
+        self._dirty = True
+
+    def takeNew(self):
+        """Return entries added by put() since the last take, clearing them.
+
+        Pool workers ship these back to the parent with each result so the
+        parent's cache sees manifests that were parsed in another process.
+        """
+        new = self._new
+        self._new = {}
+        return new
+
+    def merge(self, entries):
+        """Fold entries handed back by a worker process into this cache."""
+        if entries:
+            self._entries.update(entries)
+            self._dirty = True
+
+    def save(self):
+        """Write the cache back to disk if anything new was added."""
+        if not self._dirty:
+            return
+        try:
+            os.makedirs(os.path.dirname(self._path), exist_ok=True)
+            with open(self._path, 'w', encoding='utf-8') as f:
+                json.dump(self._entries, f)
+        except OSError:
+            # Cache persistence is best-effort; the build itself succeeded
+            pass
+
+
+# Shared cache instance, loaded once in main(). Stays None when caching is
+# unavailable (e.g. library use without main), in which case parses are direct.
+_MANIFEST_CACHE = None
+
+
+@functools.lru_cache(maxsize=256)
+def _parseManifestYaml(manifest_yaml):
+    """
+    Parse manifest YAML text into a dict, consulting the caches first.
+
+    The lru_cache layer catches manifests repeated verbatim within one run;
+    the persistent ManifestCache catches manifests unchanged across runs.
+
+    Raises:
+        yaml.YAMLError: If the manifest is not valid YAML
+    """
+    key = hashlib.blake2b(manifest_yaml.encode('utf-8'), digest_size=16).hexdigest()
+
+    if _MANIFEST_CACHE is not None:
+        cached = _MANIFEST_CACHE.get(key)
+        if cached is not None:
+            return cached
+
+    yaml, yamlLoader = _getYaml()
+    manifestData = yaml.load(manifest_yaml, Loader=yamlLoader)
+
+    if _MANIFEST_CACHE is not None and manifestData is not None:
+        _MANIFEST_CACHE.put(key, manifestData)
+
+    return manifestData
 
 
 # ============================================================================
@@ -98,17 +358,47 @@ def collectFilesFromDirectory(directory_path, allowed_extensions):
         allowed_extensions: Set of allowed file extensions (without dots)
         
     Returns:
-        List of absolute file paths
+        Sorted list of unique absolute file paths
     """
     collectedFiles = []
-    
-    for root, dirs, files in os.walk(directory_path):
-        for filename in files:
-            fileExt = os.path.splitext(filename)[1].lstrip('.')
-            if fileExt in allowed_extensions:
-                filePath = os.path.join(root, filename)
-                collectedFiles.append(os.path.abspath(filePath))
-    
+
+    # Hoist the suffix forms out of the per-file loop: str.endswith with a
+    # tuple checks every allowed suffix in a single C-level call, so no
+    # extension needs to be split out per file.
+    allowedSuffixes = tuple('.' + ext for ext in allowed_extensions if ext)
+    allowNoExtension = '' in allowed_extensions
+
+    # Manual os.scandir recursion instead of os.walk: the dirent type check
+    # avoids the extra stat per entry, and resolving the root once means every
+    # collected path is already absolute.
+    stack = [os.path.abspath(directory_path)]
+
+    while stack:
+        currentDir = stack.pop()
+        try:
+            with os.scandir(currentDir) as scanIter:
+                for dirEntry in scanIter:
+                    if dirEntry.is_dir(follow_symlinks=False):
+                        stack.append(dirEntry.path)
+                        continue
+                    if dirEntry.is_dir():
+                        # Symlink to a directory: not recursed into (matching
+                        # os.walk without followlinks) and not an input file
+                        continue
+                    name = dirEntry.name
+                    if name.endswith(allowedSuffixes):
+                        collectedFiles.append(dirEntry.path)
+                    elif allowNoExtension and ('.' not in name[1:] or name.endswith('.')):
+                        # Extensionless: a leading dot is part of the name and
+                        # a trailing dot is an empty extension
+                        collectedFiles.append(dirEntry.path)
+        except OSError:
+            # Unreadable subdirectory - skip it, as os.walk would have
+            continue
+
+    # The scandir walk visits each file once, so the list is already unique;
+    # sort here so callers get deterministic processing order directly
+    collectedFiles.sort()
     return collectedFiles
 
 
@@ -116,14 +406,32 @@ def collectFilesFromDirectory(directory_path, allowed_extensions):
 # TEMPLATE LOADING AND INSERTION POINT PROCESSING
 # ============================================================================
 
+# Valid template filename pattern: alphanumeric plus _-. symbols
+_VALID_FILENAME_RE = re.compile(r'^[a-zA-Z0-9_.-]+$')
+
+# Pool of template contents keyed by the content itself, so byte-identical
+# templates (shared header/footer fragments saved under several names) all
+# reference one string object instead of one copy per file.
+_TEMPLATE_CONTENT_POOL = {}
+
+# Cache of loaded template directories, keyed by absolute directory path.
+# Value is (signature, templates_dict, handlers_list) where the signature is a
+# tuple of (name, mtime_ns, size) per file, so re-loads after nothing changed
+# on disk (multi-page runs, repeated invocations) skip all file reads.
+_TEMPLATE_CACHE = {}
+
+
 def loadTemplates(template_dir, verbose=False):
     """
     Load all HTML templates and Python handler scripts from the templates directory.
-    
+
+    Results are cached per directory and re-validated against file mtimes/sizes,
+    so repeated calls only touch the disk when something actually changed.
+
     Args:
         template_dir: Path to the templates directory
         verbose: Enable verbose output
-        
+
     Returns:
         Tuple of (templates_dict, handler_scripts_list)
         - templates_dict: {template_id: html_content}
@@ -131,36 +439,48 @@ def loadTemplates(template_dir, verbose=False):
     """
     templates = {}
     handlers = []
-    
+
     if not os.path.exists(template_dir) or not os.path.isdir(template_dir):
         if verbose:
             print(f"{Colors.YELLOW}Template directory not found: {template_dir}{Colors.ENDC}")
         return templates, handlers
-    
-    # Valid filename pattern: alphanumeric plus _-. symbols
-    valid_filename_pattern = re.compile(r'^[a-zA-Z0-9_.-]+$')
-    
+
+    cacheKey = os.path.abspath(template_dir)
+
     # Scan immediate children only (not recursive)
+    # os.scandir piggybacks the stat info on the directory entry, so building
+    # the cache signature costs no extra syscalls over a plain listing.
+    fileEntries = []
     try:
-        entries = os.listdir(template_dir)
+        with os.scandir(template_dir) as scanIter:
+            for dirEntry in scanIter:
+                if dirEntry.is_file():
+                    entryStat = dirEntry.stat()
+                    fileEntries.append((dirEntry.name, entryStat.st_mtime_ns, entryStat.st_size))
     except OSError as e:
         print(f"{Colors.RED}ERROR: Cannot read template directory: {template_dir}{Colors.ENDC}", file=sys.stderr)
         print(f"{Colors.RED}Reason: {e}{Colors.ENDC}", file=sys.stderr)
         return templates, handlers
-    
-    for entry in entries:
+
+    fileEntries.sort()
+    signature = tuple(fileEntries)
+
+    # Serve from cache when nothing on disk has changed
+    cached = _TEMPLATE_CACHE.get(cacheKey)
+    if cached is not None and cached[0] == signature:
+        if verbose:
+            print(f"{Colors.GREEN}Using cached templates for: {template_dir}{Colors.ENDC}")
+        return cached[1], cached[2]
+
+    for entry, _mtime, _size in fileEntries:
         entry_path = os.path.join(template_dir, entry)
-        
-        # Skip directories
-        if not os.path.isfile(entry_path):
-            continue
-        
+
         # Validate filename
-        if not valid_filename_pattern.match(entry):
+        if not _VALID_FILENAME_RE.match(entry):
             if verbose:
                 print(f"{Colors.YELLOW}Skipping invalid filename: {entry}{Colors.ENDC}")
             continue
-        
+
         # Get file extension
         name_without_ext, ext = os.path.splitext(entry)
         ext = ext.lower()
@@ -168,8 +488,18 @@ def loadTemplates(template_dir, verbose=False):
         # Load HTML templates
         if ext in ['.html', '.htm']:
             try:
-                with open(entry_path, 'r', encoding='utf-8') as f:
-                    template_content = f.read()
+                # Read the whole file in one binary gulp and decode once;
+                # skips the TextIOWrapper buffering and newline translation
+                # that text mode would do per chunk
+                fd = os.open(entry_path, os.O_RDONLY)
+                try:
+                    data = os.read(fd, os.fstat(fd).st_size)
+                finally:
+                    os.close(fd)
+                # Keep the universal-newline behavior text mode provided
+                template_content = data.decode('utf-8').replace('\r\n', '\n')
+                # Deduplicate byte-identical contents through the pool
+                template_content = _TEMPLATE_CONTENT_POOL.setdefault(template_content, template_content)
                 templates[name_without_ext] = template_content
                 if verbose:
                     print(f"{Colors.CYAN}Loaded template:{Colors.ENDC} {name_without_ext}")
@@ -186,7 +516,9 @@ def loadTemplates(template_dir, verbose=False):
         print(f"{Colors.GREEN}Loaded {len(templates)} template(s){Colors.ENDC}")
     if verbose and handlers:
         print(f"{Colors.GREEN}Found {len(handlers)} handler script(s){Colors.ENDC}")
-    
+
+    _TEMPLATE_CACHE[cacheKey] = (signature, templates, handlers)
+
     return templates, handlers
 
 
@@ -203,186 +535,319 @@ def applyIndentation(content, indentation):
     """
     if not indentation:
         return content
-    
-    lines = content.split('\n')
-    # Apply indentation to all lines except the first (which is already positioned)
-    indented_lines = [lines[0]] + [indentation + line for line in lines[1:]]
-    return '\n'.join(indented_lines)
+
+    # Every line after the first (which is already positioned) gets the same
+    # prefix, so a single C-level replace beats split/prefix/join.
+    return content.replace('\n', '\n' + indentation)
 
 
-def scanInsertionPoints(html_content):
+# Manifest delimiter line: "end of manifest" alone on a line, any case,
+# optionally padded with non-newline whitespace (mirrors strip().lower())
+_MANIFEST_END_RE = re.compile(r'^[^\S\n]*end of manifest[^\S\n]*$', re.IGNORECASE | re.MULTILINE)
+
+# Combined insertion point pattern, compiled once at module scope.
+# Matches template insertions <!--$^template-name--> and special insertions
+# <!--$_KEYWORD args...--> in a single scan; dispatch on which group matched.
+_INSERTION_RE = re.compile(
+    r'<!--\$(?:\^(?P<tname>[a-zA-Z0-9_-]+)|_(?P<kw>[A-Z_]+)(?P<args>.*?))-->',
+    re.DOTALL
+)
+
+# Cache of indented template variants keyed by (content, indentation). Sites
+# insert the same template at the same depth on page after page; caching the
+# indented form moves that work from per-page to per-template. Keys hash
+# cheaply because CPython caches string hashes after the first computation.
+_INDENTED_TEMPLATE_CACHE = {}
+
+
+def _indentTemplateCached(content, indentation):
+    """Return the indented form of a template, computing it at most once."""
+    if not indentation:
+        return content
+    key = (content, indentation)
+    indented = _INDENTED_TEMPLATE_CACHE.get(key)
+    if indented is None:
+        indented = applyIndentation(content, indentation)
+        _INDENTED_TEMPLATE_CACHE[key] = indented
+    return indented
+
+
+def _parseInsertionArgs(args_section):
     """
-    Scan HTML content for HSB insertion points.
-    
+    Parse key="value" pairs from a special insertion's argument section.
+
+    Single linear scan with no regex engine startup or per-pair match object
+    allocation - only the result dict and its strings are created.
+
     Args:
-        html_content: HTML string to scan
-        
+        args_section: Raw argument text from inside the insertion comment
+
     Returns:
-        Dictionary with:
-        - 'template_insertions': List of {name, position, original, indentation}
-        - 'special_insertions': List of {keyword, arguments, position, original, indentation}
+        Dictionary of {key: value} pairs
     """
-    results = {
-        'template_insertions': [],
-        'special_insertions': []
-    }
-    
-    # Helper function to extract leading whitespace before a position
-    def get_leading_whitespace(content, pos):
-        """Get the whitespace from the start of the line to the position."""
-        # Find the start of the line
-        line_start = content.rfind('\n', 0, pos) + 1  # +1 to skip the newline itself
-        # Extract whitespace between line start and position
-        leading_text = content[line_start:pos]
-        # Return only if it's all whitespace, otherwise empty string
-        return leading_text if leading_text.strip() == '' else ''
-    
-    # Template insertions: <!--$^template-name-->
-    template_pattern = r'<!--\$\^([a-zA-Z0-9_-]+)-->'
-    for match in re.finditer(template_pattern, html_content):
-        indentation = get_leading_whitespace(html_content, match.start())
-        results['template_insertions'].append({
-            'name': match.group(1),
-            'position': match.start(),
-            'original': match.group(0),
-            'indentation': indentation
-        })
-    
-    # Special insertions: <!--$_KEYWORD args...-->
-    special_pattern = r'<!--\$_([A-Z_]+)(.*?)-->'
-    for match in re.finditer(special_pattern, html_content, re.DOTALL):
-        keyword = match.group(1)
-        args_section = match.group(2).strip()
-        
-        # Parse arguments: key="value" pairs
-        arguments = {}
-        if args_section:
-            arg_pattern = r'(\w+)="([^"]*)"'
-            for arg_match in re.finditer(arg_pattern, args_section):
-                arguments[arg_match.group(1)] = arg_match.group(2)
-        
-        indentation = get_leading_whitespace(html_content, match.start())
-        results['special_insertions'].append({
-            'keyword': keyword,
-            'arguments': arguments,
-            'position': match.start(),
-            'original': match.group(0),
-            'indentation': indentation
-        })
-    
-    return results
+    arguments = {}
+    i = 0
+    n = len(args_section)
+
+    while i < n:
+        ch = args_section[i]
+        # Skip anything that can't start a key
+        if not (ch.isalnum() or ch == '_'):
+            i += 1
+            continue
+        # Consume the key name
+        j = i
+        while j < n and (args_section[j].isalnum() or args_section[j] == '_'):
+            j += 1
+        # Expect ="value" immediately after the key
+        if j + 1 < n and args_section[j] == '=' and args_section[j + 1] == '"':
+            end = args_section.find('"', j + 2)
+            if end < 0:
+                # Unterminated value - nothing further can match
+                break
+            arguments[args_section[i:j]] = args_section[j + 2:end]
+            i = end + 1
+        else:
+            i = j
+
+    return arguments
 
 
-def applyTemplates(body_content, templates_dict, verbose=False):
+def applyTemplates(body_content, templates_dict, verbose=False, log=None):
     """
     Apply templates to insertion points in body content.
-    
+
+    Scanning and substitution happen in a single pass: template insertions
+    are expanded in place via a regex callback while special insertions are
+    collected on the side, with no intermediate list of match records.
+
     Args:
         body_content: HTML body content with insertion points
         templates_dict: Dictionary of {template_id: html_content}
         verbose: Enable verbose output
-        
+        log: Optional message buffer to append verbose output to; keeps
+            per-file messages in order with the caller's buffered log
+
     Returns:
-        Processed body content with templates applied
-        
+        Tuple of (processed body content, list of special insertion dicts);
+        reporting the special insertions is left to the caller so this
+        function stays side-effect free and safe to memoize
+
     Raises:
         ValueError: If a referenced template is not found
     """
-    # Scan for insertion points
-    insertion_points = scanInsertionPoints(body_content)
-    
-    # Process template insertions
-    # Replace in reverse order to maintain correct positions
-    template_insertions = sorted(insertion_points['template_insertions'], 
-                                key=lambda x: x['position'], 
-                                reverse=True)
-    
-    for insertion in template_insertions:
-        template_name = insertion['name']
-        
-        # Check if template exists
-        if template_name not in templates_dict:
-            raise ValueError(f"Template not found: {template_name}")
-        
-        # Get template content and apply indentation
-        template_content = templates_dict[template_name]
-        indentation = insertion.get('indentation', '')
-        indented_content = applyIndentation(template_content, indentation)
-        
-        # Replace the insertion point comment with indented template content
-        start_pos = insertion['position']
-        end_pos = start_pos + len(insertion['original'])
-        body_content = body_content[:start_pos] + indented_content + body_content[end_pos:]
-        
-        if verbose:
-            indent_info = f" (indent: {len(indentation)} spaces)" if indentation else ""
-            print(f"{Colors.GREEN}Applied template:{Colors.ENDC} {template_name}{indent_info}")
-    
-    # Log special insertions (not yet implemented)
-    special_insertions = insertion_points['special_insertions']
-    if special_insertions:
-        print(f"\n{Colors.HEADER}Special insertion points found:{Colors.ENDC}")
-        for insertion in special_insertions:
-            print(f"  {Colors.CYAN}Keyword:{Colors.ENDC} {insertion['keyword']}")
-            if insertion['arguments']:
-                print(f"  {Colors.CYAN}Arguments:{Colors.ENDC} {insertion['arguments']}")
-    
-    return body_content
+    # Precompute newline positions once so each match can find its line start
+    # with a binary search instead of re-scanning the content with rfind.
+    newline_positions = [m.start() for m in re.finditer('\n', body_content)]
+
+    def get_leading_whitespace(pos):
+        """Get the whitespace from the start of the line to the position."""
+        # Find the start of the line via the precomputed newline index
+        idx = bisect.bisect_right(newline_positions, pos - 1)
+        line_start = newline_positions[idx - 1] + 1 if idx > 0 else 0
+        # Extract whitespace between line start and position
+        leading_text = body_content[line_start:pos]
+        # Return only if it's all whitespace, otherwise empty string
+        return leading_text if leading_text.strip() == '' else ''
+
+    special_insertions = []
+
+    # Accumulate output into a StringIO: its C-level growing buffer takes
+    # amortized O(1) appends without an intermediate Python list of chunks.
+    # Special insertions are left in place, so they need no writes at all -
+    # the untouched span containing them is copied with the next cut.
+    buffer = io.StringIO()
+    write = buffer.write
+    cursor = 0
+
+    for match in _INSERTION_RE.finditer(body_content):
+        if match.group('tname'):
+            # Template insertion: <!--$^template-name-->
+            template_name = match.group('tname')
+
+            # Check if template exists
+            if template_name not in templates_dict:
+                raise ValueError(f"Template not found: {template_name}")
+
+            # Get template content and apply indentation (cached per variant)
+            indentation = get_leading_whitespace(match.start())
+            indented_content = _indentTemplateCached(templates_dict[template_name], indentation)
+
+            if verbose:
+                indent_info = f" (indent: {len(indentation)} spaces)" if indentation else ""
+                message = f"{Colors.GREEN}Applied template:{Colors.ENDC} {template_name}{indent_info}\n"
+                if log is not None:
+                    log.append(message)
+                else:
+                    sys.stdout.write(message)
+
+            # Emit everything up to the insertion point, then the template
+            write(body_content[cursor:match.start()])
+            write(indented_content)
+            cursor = match.end()
+        else:
+            # Special insertion: <!--$_KEYWORD args...--> (left in place)
+            args_section = match.group('args').strip()
+
+            # Parse arguments: key="value" pairs
+            arguments = _parseInsertionArgs(args_section) if args_section else {}
+
+            special_insertions.append({
+                'keyword': match.group('kw'),
+                'arguments': arguments
+            })
+
+    # No template insertions means the body is already final - skip the copy
+    if cursor:
+        write(body_content[cursor:])
+        body_content = buffer.getvalue()
+
+    return body_content, special_insertions
+
+
+# Template dicts registered for the memoized applyTemplates path. lru_cache
+# needs hashable arguments, so the cached wrapper takes a content key and
+# looks the actual dict up here. Keys are content digests - dicts with equal
+# contents share one key, so a recycled object can never alias a stale entry.
+_TEMPLATES_BY_KEY = {}
+
+
+def _registerTemplates(templates_dict):
+    """
+    Digest a templates dict's contents into a stable key and register it.
+
+    main() and pool workers call this once per process and thread the key
+    through to processSingleFile (the same digest also feeds the build stamp
+    version); library callers without a key get one computed per call.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for templateId in sorted(templates_dict):
+        digest.update(templateId.encode('utf-8'))
+        digest.update(b'\x00')
+        digest.update(templates_dict[templateId].encode('utf-8'))
+        digest.update(b'\x00')
+    key = digest.hexdigest()
+    _TEMPLATES_BY_KEY[key] = templates_dict
+    return key
+
+
+@functools.lru_cache(maxsize=4096)
+def _applyTemplatesCached(body_content, templates_key):
+    """
+    Memoized applyTemplates for the non-verbose path.
+
+    Sites reuse identical bodies (shared navigation/footer shells), so
+    expanding each distinct (body, templates) pair once and serving repeats
+    from the cache skips the whole scan-and-substitute pass. Returns the
+    same (content, special insertions) tuple as applyTemplates; callers do
+    the reporting, so cache hits lose nothing.
+    """
+    return applyTemplates(body_content, _TEMPLATES_BY_KEY[templates_key], verbose=False)
 
 
 # ============================================================================
 # ATTRIBUTE MANIPULATION UTILITIES
 # ============================================================================
 
-def setOrOverrideAttribute(attribute_list, attribute_name, attribute_value):
+class AttributeList:
     """
-    Set or override an attribute in an attribute list.
-    
-    If an attribute with the given name already exists (e.g., 'lang='), 
-    it will be replaced. Otherwise, the new attribute will be appended.
-    
-    Args:
-        attribute_list: List of attribute strings (e.g., ['lang="en"', 'dir="ltr"'])
-        attribute_name: Name of the attribute to set (e.g., 'lang')
-        attribute_value: Full attribute string to set (e.g., 'lang="en"')
-        
-    Returns:
-        None (modifies attribute_list in place)
+    Ordered collection of HTML tag attributes with O(1) set/override.
+
+    Attributes are stored as full strings (e.g., 'lang="en"') but indexed by
+    name, so overriding an existing attribute is a single hash probe instead
+    of a linear startswith scan over the list.
+
+    Usage:
+        attrs = AttributeList(['lang="tl"', 'dir="ltr"'])
+        attrs.set('lang', 'lang="en"')  # overrides in place
+        str(attrs)  # 'lang="en" dir="ltr"'
     """
-    attribute_prefix = f"{attribute_name}="
-    
-    # Try to find and replace existing attribute
-    for i, attr in enumerate(attribute_list):
-        if attr.startswith(attribute_prefix):
-            attribute_list[i] = attribute_value
-            return
-    
-    # If not found, append the new attribute
-    attribute_list.append(attribute_value)
+
+    __slots__ = ('_attrs',)
+
+    def __init__(self, attributes=None):
+        """Initialize with an optional list (or single string) of full attribute strings."""
+        self._attrs = {}
+        if attributes:
+            # Manifests may give a bare string instead of a list
+            if not isinstance(attributes, list):
+                attributes = [attributes]
+            for attr in attributes:
+                # Attribute name is everything before the first '='
+                self._attrs[attr.split('=', 1)[0]] = attr
+
+    def set(self, attribute_name, attribute_value):
+        """
+        Set or override an attribute.
+
+        If an attribute with the given name already exists (e.g., 'lang='),
+        it will be replaced in place. Otherwise, the new attribute will be
+        appended, preserving insertion order.
+
+        Args:
+            attribute_name: Name of the attribute to set (e.g., 'lang')
+            attribute_value: Full attribute string to set (e.g., 'lang="en"')
+        """
+        self._attrs[attribute_name] = attribute_value
+
+    def __iter__(self):
+        """Iterate over full attribute strings in insertion order."""
+        return iter(self._attrs.values())
+
+    def __str__(self):
+        """Space-separated attribute string for the opening tag."""
+        return " ".join(self._attrs.values())
 
 
 # ============================================================================
 # PER-FILE PROCESSING FUNCTION
 # ============================================================================
 
-def processSingleFile(input_path, output_dir, templates_dict=None, input_root=None, verbose=False):
+def processSingleFile(input_path, output_dir, templates_dict=None, input_root=None, verbose=False,
+                      stamp_version=None, force=False, collect_log=False, templates_key=None):
     """
     Process a single input file and generate HTML output.
-    
+
+    When stamp_version is given, a build stamp (hash of input content plus
+    the templates/builder version) is kept under .hsb_cache/stamps/; if the
+    output already exists and its stamp matches, the whole pipeline is
+    skipped for that file.
+
     Args:
         input_path: Path to the input file to process
         output_dir: Directory where output file should be written
         templates_dict: Dictionary of {template_id: html_content}
         input_root: Optional root directory for batch processing (preserves relative paths)
         verbose: Enable verbose output
-        
+        stamp_version: Combined templates/builder version string for stamping
+        force: Rebuild even when the stamp says the output is up to date
+        collect_log: Return buffered messages instead of writing them to
+            stdout (used by pool workers so the parent prints them)
+        templates_key: Content key for templates_dict from _registerTemplates,
+            computed once per run; derived on the fly when omitted
+
     Returns:
-        0 on success, 1 on error
+        0 on success, 1 on error; with collect_log, a (status, log string)
+        tuple instead
     """
     # Input is a file - get absolute path and echo it
     absPath = os.path.abspath(input_path)
-    print(f"{Colors.CYAN}Processing input file:{Colors.ENDC} {absPath}")
-    
+
+    # Per-file messages are buffered and flushed in a single stdout write on
+    # the way out; a print() per message takes the stdout lock and flushes
+    # once per line, which adds up in batch mode. Errors still go to stderr
+    # immediately.
+    log = []
+
+    def finish(status):
+        if collect_log:
+            return status, ''.join(log)
+        if log:
+            sys.stdout.write(''.join(log))
+        return status
+
+    log.append(f"{Colors.CYAN}Processing input file:{Colors.ENDC} {absPath}\n")
+
     # Determine output path, preserving directory structure if input_root is provided
     inputFilename = os.path.basename(input_path)
     outputFilename = os.path.splitext(inputFilename)[0] + '.html'
@@ -393,10 +858,9 @@ def processSingleFile(input_path, output_dir, templates_dict=None, input_root=No
         relDir = os.path.dirname(relPath)
         
         if relDir:
-            # Create subdirectory in output
-            outputSubdir = os.path.join(output_dir, relDir)
-            os.makedirs(outputSubdir, exist_ok=True)
-            outputPath = os.path.join(outputSubdir, outputFilename)
+            # Output subdirectories are pre-created in one pass by main(),
+            # so no per-file makedirs here
+            outputPath = os.path.join(output_dir, relDir, outputFilename)
         else:
             # File is directly in input_root
             outputPath = os.path.join(output_dir, outputFilename)
@@ -404,63 +868,87 @@ def processSingleFile(input_path, output_dir, templates_dict=None, input_root=No
         # Single file mode - output directly to output_dir
         outputPath = os.path.join(output_dir, outputFilename)
     
-    # Read and process the input file
+    # Read and process the input file in one binary gulp (same pattern as
+    # template loading): a single open/fstat/read/close per input keeps the
+    # syscall count per file at the floor for portable blocking I/O
     try:
-        with open(input_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        fd = os.open(input_path, os.O_RDONLY)
+        try:
+            rawContent = os.read(fd, os.fstat(fd).st_size)
+        finally:
+            os.close(fd)
+        content = rawContent.decode('utf-8').replace('\r\n', '\n')
     except Exception as e:
         print(f"{Colors.RED}ERROR: Failed to read input file: {input_path}{Colors.ENDC}", file=sys.stderr)
         print(f"{Colors.RED}Reason: {e}{Colors.ENDC}", file=sys.stderr)
-        return 1
-    
+        return finish(1)
+
+    # Incremental rebuild check: when input and templates are unchanged and
+    # the output still exists, skip parsing/templating/writing entirely
+    stampKey = None
+    stampPath = None
+    if stamp_version is not None:
+        stampKey = hashlib.blake2b(
+            content.encode('utf-8') + stamp_version.encode('utf-8'),
+            digest_size=16
+        ).hexdigest()
+        stampPath = os.path.join(CACHE_DIR, 'stamps',
+                                 os.path.relpath(outputPath, output_dir) + '.stamp')
+        if not force and os.path.exists(outputPath):
+            try:
+                with open(stampPath, 'r', encoding='utf-8') as f:
+                    previousStamp = f.read().strip()
+            except OSError:
+                previousStamp = None
+            if previousStamp == stampKey:
+                log.append(f"{Colors.GREEN}Output up to date, skipping:{Colors.ENDC} {outputPath}\n")
+                return finish(0)
+
     # Parse the manifest and body
-    # Look for "end of manifest" line (case-insensitive)
-    lines = content.split('\n')
-    manifestEndIndex = -1
-    
-    for i, line in enumerate(lines):
-        if line.strip().lower() == 'end of manifest':
-            manifestEndIndex = i
-            break
-    
+    # Look for "end of manifest" line (case-insensitive); a single multiline
+    # regex search over the raw content avoids splitting the whole file into
+    # a list of line strings just to find the delimiter
+    manifestEndMatch = _MANIFEST_END_RE.search(content)
+
     # Parse manifest YAML and extract body content
     manifest = Manifest()  # Empty manifest by default
-    htmlAttributes = []
-    bodyAttributes = []
+    htmlAttributes = AttributeList()
+    bodyAttributes = AttributeList()
 
     # Initialize frontmatter dictionary for SEO/metadata generation
     # Frontmatter includes: OpenGraph, Schema.org, Twitter Card, and other metadata
     frontmatter = {}
-    shouldGenerateFrontmatter = True
-    frontmatter['twitterCardType'] = DEFAULT_TWITTER_CARD_TYPE
 
 
-    if manifestEndIndex >= 0:
+    if manifestEndMatch:
         # Extract manifest YAML (everything before "end of manifest" line)
-        manifestLines = lines[:manifestEndIndex]
-        manifestYaml = '\n'.join(manifestLines)
+        manifestYaml = content[:manifestEndMatch.start()]
         
         # Parse YAML if there's content
         if manifestYaml.strip():
+            yaml, _ = _getYaml()
             try:
-                manifestData = yaml.safe_load(manifestYaml)
+                manifestData = _parseManifestYaml(manifestYaml)
                 if manifestData is not None:
                     manifest = Manifest(manifestData)
                     if verbose:
-                        if richAvailable:
-                            print(f"{Colors.HEADER}Parsed manifest:{Colors.ENDC}")
-                            rprint(manifest._data)
+                        rprint = _getRichPrint()
+                        if rprint is not None:
+                            log.append(f"{Colors.HEADER}Parsed manifest:{Colors.ENDC}\n")
+                            buf = io.StringIO()
+                            rprint(manifest.__dict__, file=buf)
+                            log.append(buf.getvalue())
                         else:
-                            print(f"Parsed manifest: {manifest}")
+                            log.append(f"Parsed manifest: {manifest}\n")
             except yaml.YAMLError as e:
                 print(f"{Colors.RED}ERROR: Failed to parse manifest YAML:{Colors.ENDC}", file=sys.stderr)
                 print(f"{Colors.RED}{e}{Colors.ENDC}", file=sys.stderr)
                 print(f"{Colors.YELLOW}Skipping file: {input_path}{Colors.ENDC}", file=sys.stderr)
-                return 1
+                return finish(1)
         
         # Skip the manifest and the "end of manifest" line itself
-        bodyLines = lines[manifestEndIndex + 1:]
-        bodyContent = '\n'.join(bodyLines)
+        # (slicing past the trailing newline; safe if the marker is last)
+        bodyContent = content[manifestEndMatch.end() + 1:]
     else:
         # No manifest found, use entire content
         bodyContent = content
@@ -473,115 +961,61 @@ def processSingleFile(input_path, output_dir, templates_dict=None, input_root=No
     # Add boilerplate if key is missing or if it's explicitly set to true
     shouldAddHeadBoilerplate = manifest.get('head_boilerplate', True)
     
-    # Build initial head content
-    headContent = ""
+    # Build head content as a list of parts joined once at the end;
+    # repeated += on a closure-captured string reallocates quadratically
+    head_parts = []
     if shouldAddHeadBoilerplate:
-        headContent = """
+        head_parts.append("""
 	<!-- [BASIC HEAD BOILERPLATE] -->
 	<meta charset="UTF-8">
 	<meta http-equiv="X-UA-Compatible" content="IE=edge">
-	<meta name="viewport" content="width=device-width, initial-scale=1.0">"""
+	<meta name="viewport" content="width=device-width, initial-scale=1.0">""")
 
-    # Helper function to reduce repetitive manifest-to-frontmatter mapping
-    def _map_manifest_to_frontmatter(manifest_key, frontmatter_key, label, add_to_head=None):
-        """Map a manifest value to frontmatter and optionally add to head content.
-        
-        Args:
-            manifest_key: Key to check in manifest object
-            frontmatter_key: Key to set in frontmatter dict (None to skip frontmatter)
-            label: Human-readable label for verbose output
-            add_to_head: Function that takes value and returns HTML string to add to head
-        """
-        value = getattr(manifest, manifest_key, None)
-        if value:
-            if verbose:
-                print(f"{Colors.BOLD}{label}:{Colors.ENDC} {value}")
-            if frontmatter_key:
-                frontmatter[frontmatter_key] = value
-            if add_to_head:
-                nonlocal headContent
-                headContent += add_to_head(value)
-    
-    # Web robot (spider) directives
-    _map_manifest_to_frontmatter(
-        'robotDirectives', None, 'Page robot directives',
-        lambda v: f"\n\t<meta name=\"robots\" content=\"{v}\">"
-    )
-    
-    # Basic metadata (with head content generation)
-    _map_manifest_to_frontmatter(
-        'title', 'pageTitle', 'Page title',
-        lambda v: f"\n\t<title>{v}</title>"
-    )
-    _map_manifest_to_frontmatter(
-        'description', 'pageDescription', 'Page description',
-        lambda v: f"\n\t<meta name=\"description\" content=\"{v}\">"
-    )
-    _map_manifest_to_frontmatter(
-        'keywords', 'articleTags', 'Page keywords',
-        lambda v: f"\n\t<meta name=\"keywords\" content=\"{v}\">"
-    )
-    _map_manifest_to_frontmatter(
-        'canonical', 'canonicalAddress', 'Page canonical',
-        lambda v: f"\n\t<link rel=\"canonical\" href=\"{v}\">"
-    )
-    
-    # Metadata for frontmatter only (no head content)
-    frontmatter_mappings = [
-        ('author', 'author', 'Page author'),
-        ('date_published', 'datePublished', 'Page date published'),
-        ('date_modified', 'dateModified', 'Page date modified'),
-        ('article_section', 'articleSection', 'Page article section'),
-        ('open_graph_type', 'openGraphType', 'Page open graph type'),
-        ('twitter_user', 'twitterUser', 'Page twitter user'),
-        ('main_entity_of_page', 'mainEntityOfPage', 'Schema.org main entity of page'),
-        ('schema_org_type', 'schemaOrgType', 'Schema.org type'),
-        ('page_image', 'pageImage', 'Page image'),
-        ('site_name', 'siteName', 'Site name'),
-        ('author_type', 'authorType', 'Author type'),
-        ('author_url', 'authorUrl', 'Author URL'),
-        ('publisher', 'publisher', 'Publisher name'),
-        ('publisher_type', 'publisherType', 'Publisher type'),
-        ('publisher_url', 'publisherUrl', 'Publisher URL'),
-    ]
-    
-    for manifest_key, frontmatter_key, label in frontmatter_mappings:
-        _map_manifest_to_frontmatter(manifest_key, frontmatter_key, label)
+    # Front matter generation question, read up front so the field sweep and
+    # the SEO block below skip frontmatter work entirely when opted out
+    shouldGenerateFrontmatter = not manifest.no_frontmatter
+    if shouldGenerateFrontmatter:
+        frontmatter['twitterCardType'] = DEFAULT_TWITTER_CARD_TYPE
+
+    # Sweep the manifest through the precomputed field table: verbose log,
+    # frontmatter populate, and head content in one ordered pass.
+    for getValue, frontmatterKey, label, addToHead in _FM_GETTERS:
+        value = getValue(manifest)
+        if not value:
+            continue
+        if verbose:
+            log.append(f"{Colors.BOLD}{label}:{Colors.ENDC} {value}\n")
+        if shouldGenerateFrontmatter and frontmatterKey:
+            frontmatter[frontmatterKey] = value
+        if addToHead:
+            head_parts.append(addToHead(value))
 
     # html tag attributes & body tag attributes
     # Store as objects for now, will convert to strings after all manifest checks
     if manifest.html_attributes:
         if verbose:
-            print(f"{Colors.BOLD}HTML attributes:{Colors.ENDC} {manifest.html_attributes}")
-        # Store the list directly for now
-        htmlAttributes = manifest.html_attributes if isinstance(manifest.html_attributes, list) else [manifest.html_attributes]
+            log.append(f"{Colors.BOLD}HTML attributes:{Colors.ENDC} {manifest.html_attributes}\n")
+        htmlAttributes = AttributeList(manifest.html_attributes)
     if manifest.body_attributes:
         if verbose:
-            print(f"{Colors.BOLD}Body attributes:{Colors.ENDC} {manifest.body_attributes}")
-        # Store the list directly for now
-        bodyAttributes = manifest.body_attributes if isinstance(manifest.body_attributes, list) else [manifest.body_attributes]
+            log.append(f"{Colors.BOLD}Body attributes:{Colors.ENDC} {manifest.body_attributes}\n")
+        bodyAttributes = AttributeList(manifest.body_attributes)
 
     # html language attribute
     if manifest.lang:
         if verbose:
-            print(f"{Colors.BOLD}HTML language:{Colors.ENDC} {manifest.lang}")
-        setOrOverrideAttribute(htmlAttributes, "lang", f"lang=\"{manifest.lang}\"")
+            log.append(f"{Colors.BOLD}HTML language:{Colors.ENDC} {manifest.lang}\n")
+        htmlAttributes.set("lang", f"lang=\"{manifest.lang}\"")
 
     # application role
     if manifest.is_application:
         if verbose:
-            print(f"{Colors.BOLD}Application role:{Colors.ENDC} {manifest.is_application}")
-        setOrOverrideAttribute(bodyAttributes, "role", "role=\"application\"")
-
-    # Front matter generation question
-    if manifest.no_frontmatter:
-        shouldGenerateFrontmatter = False
+            log.append(f"{Colors.BOLD}Application role:{Colors.ENDC} {manifest.is_application}\n")
+        bodyAttributes.set("role", "role=\"application\"")
 
     # Generate frontmatter (Schema.org JSON-LD, Open Graph, Twitter Card)
     if shouldGenerateFrontmatter and frontmatter:
-        import json
-        
-        frontmatterContent = "\n\n\t<!-- [SEO METADATA] -->"
+        fm_parts = ["\n\n\t<!-- [SEO METADATA] -->"]
         
         # Generate Schema.org JSON-LD
         if frontmatter.get('schemaOrgType'):
@@ -643,76 +1077,52 @@ def processSingleFile(input_path, output_dir, templates_dict=None, input_root=No
             if frontmatter.get('articleSection'):
                 jsonld['articleSection'] = frontmatter['articleSection']
             
-            # Format JSON-LD with proper indentation
+            # Format JSON-LD with proper indentation; textwrap.indent adds
+            # the tab prefix in one pass with no intermediate line list
             jsonld_str = json.dumps(jsonld, indent=2, ensure_ascii=False)
-            # Indent each line with tabs
-            jsonld_lines = jsonld_str.split('\n')
-            jsonld_indented = '\n'.join('\t\t\t' + line for line in jsonld_lines)
+            jsonld_indented = textwrap.indent(jsonld_str, '\t\t\t')
             
-            frontmatterContent += f"\n\t<script type=\"application/ld+json\">\n{jsonld_indented}\n\t</script>"
+            fm_parts.append(f"\n\t<script type=\"application/ld+json\">\n{jsonld_indented}\n\t</script>")
         
         # Generate Open Graph meta tags
         if frontmatter.get('openGraphType'):
-            frontmatterContent += "\n\n\t<!-- Open Graph (Facebook, LinkedIn, etc.) -->"
-            
-            if frontmatter.get('pageTitle'):
-                frontmatterContent += f"\n\t<meta property=\"og:title\" content=\"{frontmatter['pageTitle']}\">"
-            if frontmatter.get('openGraphType'):
-                frontmatterContent += f"\n\t<meta property=\"og:type\" content=\"{frontmatter['openGraphType']}\">"
-            if frontmatter.get('canonicalAddress'):
-                frontmatterContent += f"\n\t<meta property=\"og:url\" content=\"{frontmatter['canonicalAddress']}\">"
-            if frontmatter.get('pageImage'):
-                frontmatterContent += f"\n\t<meta property=\"og:image\" content=\"{frontmatter['pageImage']}\">"
-            if frontmatter.get('pageDescription'):
-                frontmatterContent += f"\n\t<meta property=\"og:description\" content=\"{frontmatter['pageDescription']}\">"
-            if frontmatter.get('siteName'):
-                frontmatterContent += f"\n\t<meta property=\"og:site_name\" content=\"{frontmatter['siteName']}\">"
-            
+            fm_parts.append("\n\n\t<!-- Open Graph (Facebook, LinkedIn, etc.) -->")
+            fm_parts.extend(tag.format(_escapeAttr(frontmatter[key]))
+                            for key, tag in _OG_FIELDS if frontmatter.get(key))
+
             # Article-specific Open Graph tags
             if frontmatter.get('openGraphType') == 'article':
                 if frontmatter.get('datePublished'):
                     date_pub = frontmatter['datePublished']
                     date_str = date_pub.isoformat() if hasattr(date_pub, 'isoformat') else str(date_pub)
-                    frontmatterContent += f"\n\t<meta property=\"article:published_time\" content=\"{date_str}\">"
-                if frontmatter.get('author'):
-                    frontmatterContent += f"\n\t<meta property=\"article:author\" content=\"{frontmatter['author']}\">"
-                if frontmatter.get('articleSection'):
-                    frontmatterContent += f"\n\t<meta property=\"article:section\" content=\"{frontmatter['articleSection']}\">"
-                if frontmatter.get('articleTags'):
-                    frontmatterContent += f"\n\t<meta property=\"article:tag\" content=\"{frontmatter['articleTags']}\">"
-        
+                    fm_parts.append(f"\n\t<meta property=\"article:published_time\" content=\"{date_str}\">")
+                fm_parts.extend(tag.format(_escapeAttr(frontmatter[key]))
+                                for key, tag in _OG_ARTICLE_FIELDS if frontmatter.get(key))
+
         # Generate Twitter Card meta tags
         if frontmatter.get('twitterCardType'):
-            frontmatterContent += "\n\n\t<!-- Twitter Card -->"
-            
-            frontmatterContent += f"\n\t<meta name=\"twitter:card\" content=\"{frontmatter['twitterCardType']}\">"
-            if frontmatter.get('pageTitle'):
-                frontmatterContent += f"\n\t<meta name=\"twitter:title\" content=\"{frontmatter['pageTitle']}\">"
-            if frontmatter.get('pageDescription'):
-                frontmatterContent += f"\n\t<meta name=\"twitter:description\" content=\"{frontmatter['pageDescription']}\">"
-            if frontmatter.get('pageImage'):
-                frontmatterContent += f"\n\t<meta name=\"twitter:image\" content=\"{frontmatter['pageImage']}\">"
-            if frontmatter.get('twitterUser'):
-                twitter_user = frontmatter['twitterUser']
-                frontmatterContent += f"\n\t<meta name=\"twitter:site\" content=\"{twitter_user}\">"
-                frontmatterContent += f"\n\t<meta name=\"twitter:creator\" content=\"{twitter_user}\">"
+            fm_parts.append("\n\n\t<!-- Twitter Card -->")
+            fm_parts.extend(tag.format(_escapeAttr(frontmatter[key]))
+                            for key, tag in _TWITTER_FIELDS if frontmatter.get(key))
         
         # Add frontmatter to head content
-        headContent += frontmatterContent
+        head_parts.extend(fm_parts)
 
     # THIS MANIFEST CHECK SHOULD ALWAYS BE LAST
     # Determine if there are add_to_header items to be appended to the head
     if manifest.add_to_header:
-        headContent += "\n\n"
+        head_parts.append("\n\n")
         if verbose:
-            print(f"\t{Colors.BOLD}Adding to header:{Colors.ENDC} {manifest.add_to_header}")
-        for item in manifest.add_to_header:
-            headContent += "\t" + item
+            log.append(f"\t{Colors.BOLD}Adding to header:{Colors.ENDC} {manifest.add_to_header}\n")
+        head_parts.extend("\t" + item for item in manifest.add_to_header)
     
+    # Join the accumulated head parts in one pass
+    headContent = ''.join(head_parts)
+
     # CONVERT ATTRIBUTES TO STRINGS
     # After all manifest checks are complete, convert attribute objects to strings
-    htmlAttributesStr = " ".join(htmlAttributes) if isinstance(htmlAttributes, list) else ""
-    bodyAttributesStr = " ".join(bodyAttributes) if isinstance(bodyAttributes, list) else ""
+    htmlAttributesStr = str(htmlAttributes)
+    bodyAttributesStr = str(bodyAttributes)
     
     # APPLY TEMPLATES TO BODY CONTENT
     # Process template insertion points if templates are available
@@ -720,42 +1130,106 @@ def processSingleFile(input_path, output_dir, templates_dict=None, input_root=No
         templates_dict = {}
     
     try:
-        bodyContent = applyTemplates(bodyContent, templates_dict, verbose=verbose)
+        if verbose:
+            # Verbose runs bypass the memo so per-template logs still print
+            bodyContent, specialInsertions = applyTemplates(bodyContent, templates_dict,
+                                                            verbose=True, log=log)
+        else:
+            if templates_key is None:
+                # Library callers without a precomputed key get one per call
+                templates_key = _registerTemplates(templates_dict)
+            bodyContent, specialInsertions = _applyTemplatesCached(bodyContent, templates_key)
     except ValueError as e:
         print(f"{Colors.RED}ERROR: {e}{Colors.ENDC}", file=sys.stderr)
         print(f"{Colors.YELLOW}Skipping file: {input_path}{Colors.ENDC}", file=sys.stderr)
-        return 1
-    # Wrap the body content in proper HTML structure
-    outputContent = f"""<!DOCTYPE html>
-<html {htmlAttributesStr}>
-<head>{headContent}
-</head>
-<body {bodyAttributesStr}>
-
-<!-- START OF HSB TEXT -->
-{bodyContent}
-<!-- END OF HSB TEXT -->
-
-</body>
-</html>"""
-    
+        return finish(1)
+
+    # Report special insertions (not yet implemented); done here rather than
+    # inside applyTemplates so cache hits still report and the messages stay
+    # in the buffered per-file log
+    if specialInsertions:
+        log.append(f"\n{Colors.HEADER}Special insertion points found:{Colors.ENDC}\n")
+        for insertion in specialInsertions:
+            log.append(f"  {Colors.CYAN}Keyword:{Colors.ENDC} {insertion['keyword']}\n")
+            if insertion['arguments']:
+                log.append(f"  {Colors.CYAN}Arguments:{Colors.ENDC} {insertion['arguments']}\n")
+    # Wrap the body content in proper HTML structure, streaming the parts
+    # straight to the output file instead of materializing one giant string
+    # (halves peak memory for large expanded bodies). The large buffer keeps
+    # it to roughly one write syscall per page.
+    outputParts = (
+        '<!DOCTYPE html>\n<html ', htmlAttributesStr,
+        '>\n<head>', headContent,
+        '\n</head>\n<body ', bodyAttributesStr,
+        '>\n\n<!-- START OF HSB TEXT -->\n', bodyContent,
+        '\n<!-- END OF HSB TEXT -->\n\n</body>\n</html>'
+    )
+
     # Write the processed content to output (overwrite if exists)
     try:
-        with open(outputPath, 'w', encoding='utf-8') as f:
-            f.write(outputContent)
-        print(f"\n{Colors.BOLD}{'='*60}{Colors.ENDC}")
-        print(f"{Colors.GREEN}Page generation completed successfully!{Colors.ENDC}")
-        print(f"{Colors.BOLD}{'='*60}{Colors.ENDC}")
-        print(f"{Colors.BOLD}Input file:{Colors.ENDC}  {absPath}")
-        print(f"{Colors.BOLD}Output file:{Colors.ENDC} {outputPath}")
-        print(f"{Colors.BOLD}Output size:{Colors.ENDC} {len(outputContent)} bytes")
-        print(f"{Colors.BOLD}{'='*60}{Colors.ENDC}\n")
+        outputSize = 0
+        with open(outputPath, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            for part in outputParts:
+                f.write(part)
+                outputSize += len(part)
+        log.append(f"\n{Colors.BOLD}{'='*60}{Colors.ENDC}\n"
+                   f"{Colors.GREEN}Page generation completed successfully!{Colors.ENDC}\n"
+                   f"{Colors.BOLD}{'='*60}{Colors.ENDC}\n"
+                   f"{Colors.BOLD}Input file:{Colors.ENDC}  {absPath}\n"
+                   f"{Colors.BOLD}Output file:{Colors.ENDC} {outputPath}\n"
+                   f"{Colors.BOLD}Output size:{Colors.ENDC} {outputSize} bytes\n"
+                   f"{Colors.BOLD}{'='*60}{Colors.ENDC}\n\n")
     except Exception as e:
         print(f"{Colors.RED}ERROR: Failed to write output file: {outputPath}{Colors.ENDC}", file=sys.stderr)
         print(f"{Colors.RED}Reason: {e}{Colors.ENDC}", file=sys.stderr)
-        return 1
-    
-    return 0
+        return finish(1)
+
+    # Record the build stamp so an unchanged input can be skipped next run
+    if stampKey is not None:
+        try:
+            os.makedirs(os.path.dirname(stampPath), exist_ok=True)
+            with open(stampPath, 'w', encoding='utf-8') as f:
+                f.write(stampKey)
+        except OSError:
+            # Stamping is best-effort; worst case the file rebuilds next run
+            pass
+
+    return finish(0)
+
+
+# ============================================================================
+# PARALLEL WORKER SUPPORT
+# ============================================================================
+
+# Templates for the current worker process, installed once per worker by
+# _initWorker instead of being pickled along with every submitted task.
+# On Linux the fork start method makes this effectively zero-copy.
+_WORKER_TEMPLATES = None
+_WORKER_TEMPLATES_KEY = None
+
+
+def _initWorker(templates_dict):
+    """Process pool initializer: stash and register the shared template dict."""
+    global _WORKER_TEMPLATES, _WORKER_TEMPLATES_KEY
+    _WORKER_TEMPLATES = templates_dict
+    _WORKER_TEMPLATES_KEY = _registerTemplates(templates_dict)
+
+
+def _processFileInWorker(file_path, output_dir, input_root, verbose, stamp_version, force):
+    """
+    Worker-side wrapper that supplies the per-process template dict.
+
+    Returns (status, log string, new manifest cache entries); the parent
+    prints the log so worker processes never contend on the shared stdout,
+    and merges the cache entries so manifests parsed in workers still reach
+    the persistent cache.
+    """
+    status, logText = processSingleFile(file_path, output_dir, templates_dict=_WORKER_TEMPLATES,
+                                        input_root=input_root, verbose=verbose,
+                                        stamp_version=stamp_version, force=force,
+                                        collect_log=True, templates_key=_WORKER_TEMPLATES_KEY)
+    newManifests = _MANIFEST_CACHE.takeNew() if _MANIFEST_CACHE is not None else {}
+    return status, logText, newManifests
 
 
 # ============================================================================
@@ -780,6 +1254,12 @@ def main():
         action='store_true',
         help='Enable verbose output'
     )
+
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Rebuild all files even if their output is up to date'
+    )
     
     parser.add_argument(
         '--template-dir',
@@ -801,8 +1281,10 @@ def main():
     )
     
     args = parser.parse_args()
-    
+
     if args.verbose:
+        global _VERBOSE_IMPORTS
+        _VERBOSE_IMPORTS = True
         print(f"Python version: {sys.version}")
         print(f"Arguments: {args}")
     
@@ -864,8 +1346,8 @@ def main():
     # Define allowed file extensions
     allowedExtensions = ALLOWED_EXTENSIONS
     
-    # Build set of files to process
-    filesToProcess = set()
+    # Build list of files to process (sorted, unique)
+    filesToProcess = []
     inputRoot = None
     
     if os.path.isdir(inputPath):
@@ -877,8 +1359,9 @@ def main():
             print(f"WARNING: No files with valid extensions found in directory: {inputPath}")
             return 0
         
-        filesToProcess = set(collectedFiles)
-        
+        # Already sorted and unique straight from the walk
+        filesToProcess = collectedFiles
+
         if args.verbose:
             print(f"\n{Colors.BOLD}Batch processing mode:{Colors.ENDC} Found {len(filesToProcess)} file(s) to process")
             print(f"{Colors.BOLD}Input directory:{Colors.ENDC} {inputRoot}")
@@ -892,17 +1375,76 @@ def main():
             print(f"ERROR: Invalid file extension '.{fileExt}'. Allowed extensions: {', '.join(sorted([f'.{e}' if e else '(no extension)' for e in allowedExtensions]))}", file=sys.stderr)
             return 1
         
-        filesToProcess = {os.path.abspath(inputPath)}
+        filesToProcess = [os.path.abspath(inputPath)]
     
+    # Load the persistent manifest cache so unchanged manifests skip YAML
+    global _MANIFEST_CACHE
+    _MANIFEST_CACHE = ManifestCache()
+    _MANIFEST_CACHE.load()
+
+    # Content key for the templates dict, computed once per run; it feeds
+    # both the memoized template expansion and the build stamp version
+    templatesKey = _registerTemplates(templates_dict)
+
+    # Version string covering everything besides the input file itself that
+    # feeds an output: template contents and the builder code. Hashed into
+    # each file's build stamp so template or builder changes force rebuilds.
+    versionHash = hashlib.blake2b(digest_size=16)
+    versionHash.update(templatesKey.encode('utf-8'))
+    versionHash.update(str(os.path.getmtime(__file__)).encode('utf-8'))
+    stampVersion = versionHash.hexdigest()
+
     # Process each file in the set
     successCount = 0
     failCount = 0
     failedFiles = []
-    
+
     totalFiles = len(filesToProcess)
-    
-    for filePath in sorted(list(filesToProcess)):
-        result = processSingleFile(filePath, outputDir, templates_dict=templates_dict, input_root=inputRoot, verbose=args.verbose)
+
+    # Create each output subdirectory exactly once up front; a per-file
+    # makedirs(exist_ok=True) re-stats every path component for every file
+    # sharing a parent directory
+    if inputRoot:
+        outputSubdirs = {os.path.dirname(os.path.relpath(filePath, inputRoot))
+                         for filePath in filesToProcess}
+        for relDir in outputSubdirs:
+            if relDir:
+                os.makedirs(os.path.join(outputDir, relDir), exist_ok=True)
+
+    # Each file's pipeline (YAML parse, template substitution, head building)
+    # is CPU-bound and independent of every other file, so batch builds fan
+    # out across cores. Small batches stay serial - pool spin-up would cost
+    # more than it saves.
+    if totalFiles >= MIN_FILES_FOR_PARALLEL and (os.cpu_count() or 1) > 1:
+        results = [1] * totalFiles
+        fileIndex = {filePath: i for i, filePath in enumerate(filesToProcess)}
+        with concurrent.futures.ProcessPoolExecutor(initializer=_initWorker,
+                                                    initargs=(templates_dict,)) as executor:
+            futures = {
+                executor.submit(_processFileInWorker, filePath, outputDir,
+                                inputRoot, args.verbose, stampVersion, args.force): filePath
+                for filePath in filesToProcess
+            }
+            for future in concurrent.futures.as_completed(futures):
+                filePath = futures[future]
+                try:
+                    status, workerLog, newManifests = future.result()
+                    if workerLog:
+                        sys.stdout.write(workerLog)
+                    _MANIFEST_CACHE.merge(newManifests)
+                    results[fileIndex[filePath]] = status
+                except Exception as e:
+                    # A crashed worker file counts as failed without taking
+                    # the rest of the batch down with it
+                    print(f"{Colors.RED}ERROR: Unexpected failure processing {filePath}: {e}{Colors.ENDC}", file=sys.stderr)
+                    results[fileIndex[filePath]] = 1
+    else:
+        results = [processSingleFile(filePath, outputDir, templates_dict=templates_dict, input_root=inputRoot, verbose=args.verbose,
+                                     stamp_version=stampVersion, force=args.force,
+                                     templates_key=templatesKey)
+                   for filePath in filesToProcess]
+
+    for filePath, result in zip(filesToProcess, results):
         if result == 0:
             successCount += 1
         else:
@@ -913,7 +1455,10 @@ def main():
             else:
                 friendlyName = os.path.basename(filePath)
             failedFiles.append(friendlyName)
-    
+
+    # Persist any newly parsed manifests for the next run
+    _MANIFEST_CACHE.save()
+
     # If we processed multiple files (batch mode), print a summary
     if len(filesToProcess) > 1 or inputRoot:
         print("\n" + f"{Colors.BOLD}{'='*60}{Colors.ENDC}")